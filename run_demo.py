@@ -11,136 +11,147 @@ Usage:
 """
 
 import asyncio
+import functools
+import io
 import sys
-from pathlib import Path
 
-# Add the scraper directory to Python path
-sys.path.append(str(Path(__file__).parent / "scraper"))
+from scraper.demo_scraper import main
 
-from demo_scraper import main
+
+def _flush(buf: io.StringIO) -> None:
+    """Write a buffered block of output to stdout in one go"""
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
 
 async def run_demo():
     """Run the demo scraper and display results"""
-    print("🚀 Starting Demo Scraper - Ticket 2 Implementation")
-    print("=" * 60)
-    print("This demonstrates all the functionality:")
-    print("✅ HTML saving with timestamps")
-    print("✅ Screenshot saving with timestamps")
-    print("✅ Proper logging with loguru")
-    print("✅ Error handling and recovery")
-    print("✅ Data extraction")
-    print("✅ Beautiful console output with Rich")
-    print("=" * 60)
+    # Build each block of output in memory and write it with a single call
+    buf = io.StringIO()
+    p = functools.partial(print, file=buf)
+    p("🚀 Starting Demo Scraper - Ticket 2 Implementation")
+    p("=" * 60)
+    p("This demonstrates all the functionality:")
+    p("✅ HTML saving with timestamps")
+    p("✅ Screenshot saving with timestamps")
+    p("✅ Proper logging with loguru")
+    p("✅ Error handling and recovery")
+    p("✅ Data extraction")
+    p("✅ Beautiful console output with Rich")
+    p("=" * 60)
+    _flush(buf)
     
     try:
         # Run the demo scraper
         results = await main()
         
         # Display summary
-        print("\n" + "=" * 60)
-        print("📊 DEMO SCRAPING SUMMARY")
-        print("=" * 60)
-        print(f"Success: {'✅ Yes' if results.get('success') else '❌ No'}")
-        print(f"Timestamp: {results.get('timestamp', 'N/A')}")
-        print(f"Page Title: {results.get('title', 'N/A')}")
-        print(f"HTML File: {results.get('html_file', 'Not saved')}")
-        print(f"Screenshot: {results.get('screenshot_file', 'Not saved')}")
-        print(f"Elements Found: {results.get('headings_found', 0)}")
-        print(f"Errors: {len(results.get('errors', []))}")
+        buf = io.StringIO()
+        p = functools.partial(print, file=buf)
+        p("\n" + "=" * 60)
+        p("📊 DEMO SCRAPING SUMMARY")
+        p("=" * 60)
+        p(f"Success: {'✅ Yes' if results.get('success') else '❌ No'}")
+        p(f"Timestamp: {results.get('timestamp', 'N/A')}")
+        p(f"Page Title: {results.get('title', 'N/A')}")
+        p(f"HTML File: {results.get('html_file', 'Not saved')}")
+        p(f"Screenshot: {results.get('screenshot_file', 'Not saved')}")
+        p(f"Elements Found: {results.get('headings_found', 0)}")
+        p(f"Errors: {len(results.get('errors', []))}")
         
         if results.get('errors'):
-            print("\n⚠️ ERRORS:")
+            p("\n⚠️ ERRORS:")
             for error in results['errors']:
-                print(f"  • {error}")
+                p(f"  • {error}")
         
         # Show what was learned
-        print("\n" + "=" * 60)
-        print("🎓 WHAT YOU LEARNED TODAY (4 hours of work)")
-        print("=" * 60)
-        print("✅ 1. Browser Management with Playwright")
-        print("   - Launch browser with proper settings")
-        print("   - Create context with locale")
-        print("   - Handle page navigation")
-        print("   - Proper cleanup with async context managers")
-        
-        print("\n✅ 2. HTML and Screenshot Saving")
-        print("   - Save HTML content to timestamped files")
-        print("   - Take full-page screenshots")
-        print("   - Organize files in proper directory structure")
-        
-        print("\n✅ 3. Advanced Logging with Loguru")
-        print("   - Structured logging with timestamps")
-        print("   - Log rotation and retention")
-        print("   - Different log levels (INFO, ERROR, DEBUG)")
-        
-        print("\n✅ 4. Error Handling and Recovery")
-        print("   - Try-catch blocks for each operation")
-        print("   - Graceful error recovery")
-        print("   - Detailed error reporting")
-        
-        print("\n✅ 5. Beautiful Console Output with Rich")
-        print("   - Colored output and emojis")
-        print("   - Tables and panels")
-        print("   - Progress indicators")
-        
-        print("\n✅ 6. Data Extraction")
-        print("   - Extract structured data from web pages")
-        print("   - Handle dynamic content")
-        print("   - Store results in organized format")
-        
-        print("\n✅ 7. Configuration Management")
-        print("   - Separate config files")
-        print("   - Multiple URL fallbacks")
-        print("   - Configurable settings")
-        
-        print("\n✅ 8. Project Structure")
-        print("   - Modular code organization")
-        print("   - Proper imports and dependencies")
-        print("   - Clean separation of concerns")
-        
-        print("\n" + "=" * 60)
-        print("🎯 TOMORROW'S WORK (Remaining 36 hours)")
-        print("=" * 60)
-        print("📋 1. Fix Zara blocking issues")
-        print("   - Add proxy support")
-        print("   - Implement retry mechanisms")
-        print("   - Add more browser stealth options")
-        
-        print("\n📋 2. Enhanced Data Extraction")
-        print("   - Parse product information")
-        print("   - Extract prices and availability")
-        print("   - Handle different page layouts")
-        
-        print("\n📋 3. Database Integration")
-        print("   - Set up PostgreSQL connection")
-        print("   - Create database schema")
-        print("   - Store scraped data")
-        
-        print("\n📋 4. Change Detection")
-        print("   - Compare HTML hashes")
-        print("   - Detect new products")
-        print("   - Track changes over time")
-        
-        print("\n📋 5. Popularity Scoring")
-        print("   - Analyze product positioning")
-        print("   - Calculate popularity metrics")
-        print("   - Identify bestsellers")
-        
-        print("\n📋 6. CSV Export")
-        print("   - Export data to CSV format")
-        print("   - Handle different data types")
-        print("   - Create reports")
-        
-        print("\n📋 7. Scheduling and Automation")
-        print("   - Set up cron jobs")
-        print("   - Automated runs every 14 days")
-        print("   - Email notifications")
-        
-        print("\n📋 8. Testing and Documentation")
-        print("   - Unit tests for each component")
-        print("   - Integration tests")
-        print("   - Complete documentation")
+        p("\n" + "=" * 60)
+        p("🎓 WHAT YOU LEARNED TODAY (4 hours of work)")
+        p("=" * 60)
+        p("✅ 1. Browser Management with Playwright")
+        p("   - Launch browser with proper settings")
+        p("   - Create context with locale")
+        p("   - Handle page navigation")
+        p("   - Proper cleanup with async context managers")
+        
+        p("\n✅ 2. HTML and Screenshot Saving")
+        p("   - Save HTML content to timestamped files")
+        p("   - Take full-page screenshots")
+        p("   - Organize files in proper directory structure")
+        
+        p("\n✅ 3. Advanced Logging with Loguru")
+        p("   - Structured logging with timestamps")
+        p("   - Log rotation and retention")
+        p("   - Different log levels (INFO, ERROR, DEBUG)")
+        
+        p("\n✅ 4. Error Handling and Recovery")
+        p("   - Try-catch blocks for each operation")
+        p("   - Graceful error recovery")
+        p("   - Detailed error reporting")
+        
+        p("\n✅ 5. Beautiful Console Output with Rich")
+        p("   - Colored output and emojis")
+        p("   - Tables and panels")
+        p("   - Progress indicators")
+        
+        p("\n✅ 6. Data Extraction")
+        p("   - Extract structured data from web pages")
+        p("   - Handle dynamic content")
+        p("   - Store results in organized format")
+        
+        p("\n✅ 7. Configuration Management")
+        p("   - Separate config files")
+        p("   - Multiple URL fallbacks")
+        p("   - Configurable settings")
+        
+        p("\n✅ 8. Project Structure")
+        p("   - Modular code organization")
+        p("   - Proper imports and dependencies")
+        p("   - Clean separation of concerns")
+        
+        p("\n" + "=" * 60)
+        p("🎯 TOMORROW'S WORK (Remaining 36 hours)")
+        p("=" * 60)
+        p("📋 1. Fix Zara blocking issues")
+        p("   - Add proxy support")
+        p("   - Implement retry mechanisms")
+        p("   - Add more browser stealth options")
+        
+        p("\n📋 2. Enhanced Data Extraction")
+        p("   - Parse product information")
+        p("   - Extract prices and availability")
+        p("   - Handle different page layouts")
+        
+        p("\n📋 3. Database Integration")
+        p("   - Set up PostgreSQL connection")
+        p("   - Create database schema")
+        p("   - Store scraped data")
+        
+        p("\n📋 4. Change Detection")
+        p("   - Compare HTML hashes")
+        p("   - Detect new products")
+        p("   - Track changes over time")
+        
+        p("\n📋 5. Popularity Scoring")
+        p("   - Analyze product positioning")
+        p("   - Calculate popularity metrics")
+        p("   - Identify bestsellers")
+        
+        p("\n📋 6. CSV Export")
+        p("   - Export data to CSV format")
+        p("   - Handle different data types")
+        p("   - Create reports")
+        
+        p("\n📋 7. Scheduling and Automation")
+        p("   - Set up cron jobs")
+        p("   - Automated runs every 14 days")
+        p("   - Email notifications")
+        
+        p("\n📋 8. Testing and Documentation")
+        p("   - Unit tests for each component")
+        p("   - Integration tests")
+        p("   - Complete documentation")
+        _flush(buf)
         
         return results.get('success', False)
         
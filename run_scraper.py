@@ -4,6 +4,8 @@ Simple script to run the Zara scraper
 =====================================
 
 This script runs the enhanced scraper and displays results.
+If the scraper daemon (python -m scraper.daemon) is running, the scrape
+is handed to it so the browser doesn't have to be started again.
 Use this for testing and development.
 
 Usage:
@@ -12,12 +14,9 @@ Usage:
 
 import asyncio
 import sys
-from pathlib import Path
 
-# Add the scraper directory to Python path
-sys.path.append(str(Path(__file__).parent / "scraper"))
-
-from zara_scraper import main
+from scraper.daemon import request_scrape
+from scraper.zara_scraper import main
 
 
 async def run_test():
@@ -26,8 +25,10 @@ async def run_test():
     print("=" * 50)
     
     try:
-        # Run the scraper
-        results = await main()
+        # Use the running daemon if there is one, otherwise scrape in-process
+        results = await request_scrape()
+        if results is None:
+            results = await main()
         
         # Display summary
         print("\n" + "=" * 50)
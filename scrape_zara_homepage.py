@@ -1,48 +1,136 @@
 import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
 from typing import List, Dict
 
-from playwright.async_api import async_playwright
-from rich import print
+import orjson
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
+from scraper.config import (
+    BROWSER_RECYCLE_PAGES,
+    BROWSER_SETTINGS,
+    COOKIE_SELECTOR_UNION,
+    COOKIE_TEXT_REGEX,
+    MAX_PARALLEL_PAGES,
+    OUTPUT_PATHS,
+    SCRAPING_CONFIG,
+    ZARA_URLS,
+    ensure_output_dirs,
+)
 
-ZARA_HOME_URL = "https://www.zara.com/"
+
+HERO_SELECTOR = "a:visible:has-text('SHOP'), a[href*='/shop'], a[href*='/collection']"
+# Resource types that are never needed to read anchor text/hrefs
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
 
 
 async def extract_hero_banners(page) -> List[Dict[str, str]]:
-    await page.wait_for_load_state("networkidle")
-    # Zara homepage uses dynamic content; we target anchor tags in hero sections
-    locator = page.locator("a:visible").filter(has_text="SHOP")
-    banners: List[Dict[str, str]] = []
-    count = await locator.count()
-    for i in range(min(count, 20)):
-        element = locator.nth(i)
-        href = await element.get_attribute("href")
-        text = await element.inner_text()
-        if href:
-            banners.append({"text": text.strip(), "href": href})
+    # Zara's trackers keep the network busy, so gate on hero content instead of networkidle
+    await page.wait_for_load_state("domcontentloaded")
+    # .first can be a hidden nav link, so a timeout just means "read what's there"
+    try:
+        await page.locator(HERO_SELECTOR).first.wait_for(state="visible", timeout=5000)
+    except PlaywrightTimeoutError:
+        pass
+    # Zara homepage uses dynamic content; we target anchor tags in hero sections.
+    # Read text and href for every candidate in a single round-trip to the browser.
+    banners: List[Dict[str, str]] = await page.eval_on_selector_all(
+        "a:visible",
+        """(els, limit) => els
+             .filter(e => /SHOP/i.test(e.innerText))
+             .slice(0, limit)
+             .map(e => ({text: e.innerText.trim(), href: e.getAttribute('href')}))
+             .filter(b => b.href)""",
+        SCRAPING_CONFIG["max_banners"],
+    )
     return banners
 
 
-async def main() -> None:
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(locale="en-US")
-        page = await context.new_page()
-        await page.goto(ZARA_HOME_URL, wait_until="load")
+async def _block_heavy_resources(route) -> None:
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
 
-        # Accept cookies if prompt exists to avoid blocking content
+async def _dismiss_cookies(page) -> None:
+    # Accept cookies if prompt exists to avoid blocking content
+    try:
+        await page.locator(COOKIE_SELECTOR_UNION).first.click(timeout=2000)
+    except Exception:
         try:
-            accept = page.get_by_role("button", name=lambda n: n and "accept" in n.lower())
+            accept = page.get_by_role("button", name=COOKIE_TEXT_REGEX)
             if await accept.count() > 0:
                 await accept.first.click()
         except Exception:
             pass
 
+
+async def scrape_one(context, url: str) -> Dict[str, object]:
+    # One-shot script, so the per-route bookkeeping never has time to grow
+    await context.route("**/*", _block_heavy_resources)
+    page = await context.new_page()
+    page.set_default_navigation_timeout(15000)
+    # Return once the response commits; extract_hero_banners gates on real content
+    await page.goto(url, wait_until="commit", timeout=15000)
+
+    # The cookie overlay doesn't stop DOM queries, so dismiss it alongside extraction
+    cookie_task = asyncio.create_task(_dismiss_cookies(page))
+    try:
         banners = await extract_hero_banners(page)
-        print({"count": len(banners), "banners": banners})
+    finally:
+        try:
+            await asyncio.wait_for(cookie_task, timeout=2)
+        except asyncio.TimeoutError:
+            pass
+    return {"url": url, "count": len(banners), "banners": banners}
+
+
+def save_results(payload: bytes) -> Path:
+    ensure_output_dirs()
+    out = OUTPUT_PATHS["json"] / f"zara_homepage_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    out.write_bytes(payload)
+    return out
+
+
+async def main() -> None:
+    async with async_playwright() as p:
+        # Cap resident contexts so per-context heap growth can't pile up
+        sem = asyncio.Semaphore(MAX_PARALLEL_PAGES)
+
+        async def guarded(browser, url: str) -> Dict[str, object]:
+            async with sem:
+                # Record a failing URL instead of letting it sink the whole batch
+                try:
+                    context = await browser.new_context(locale="en-US")
+                except Exception as e:
+                    return {"url": url, "error": str(e)}
+                try:
+                    return await scrape_one(context, url)
+                except Exception as e:
+                    return {"url": url, "error": str(e)}
+                finally:
+                    await context.close()
+
+        # Chromium leaks heap over long runs, so relaunch it every BROWSER_RECYCLE_PAGES
+        # pages; within a batch every URL gets its own cheap, isolated context
+        results: List[Dict[str, object]] = []
+        for start in range(0, len(ZARA_URLS), BROWSER_RECYCLE_PAGES):
+            batch = ZARA_URLS[start:start + BROWSER_RECYCLE_PAGES]
+            browser = await p.chromium.launch(
+                headless=BROWSER_SETTINGS["headless"],
+                args=list(BROWSER_SETTINGS["args"]),
+            )
+            try:
+                results += await asyncio.gather(*[guarded(browser, url) for url in batch])
+            finally:
+                await browser.close()
 
-        await context.close()
-        await browser.close()
+        # orjson produces bytes directly; serialize once for both the file and stdout
+        payload = orjson.dumps(results, option=orjson.OPT_APPEND_NEWLINE)
+        save_results(payload)
+        sys.stdout.buffer.write(payload)
 
 
 if __name__ == "__main__":
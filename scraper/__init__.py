@@ -0,0 +1,7 @@
+"""
+Zara Homepage Scraper package
+=============================
+
+Run the scraper with ``python -m scraper`` or the ``zara-scrape``
+console script.
+"""
@@ -0,0 +1,6 @@
+"""Entry point for ``python -m scraper``"""
+
+from scraper.zara_scraper import cli
+
+if __name__ == "__main__":
+    cli()
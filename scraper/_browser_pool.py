@@ -0,0 +1,100 @@
+"""
+Shared Browser Pool
+===================
+
+Process-wide Playwright driver and browsers. Starting the driver and
+launching Chromium is the largest fixed cost of a scrape, so it is paid
+once per process: every caller gets the same Browser for a given
+(browser_type, headless) pair and only creates its own cheap
+BrowserContext on it.
+
+Usage:
+    browser = await get_browser(headless=True, args=[...])
+    context = await browser.new_context()
+    ...
+    await close_browsers()  # once, before the event loop exits
+"""
+
+import asyncio
+from typing import Dict, Optional, Sequence, Tuple
+
+from playwright.async_api import async_playwright, Browser, Playwright
+from loguru import logger
+
+_playwright: Optional[Playwright] = None
+_browsers: Dict[Tuple[str, bool], Browser] = {}
+_lock: Optional[asyncio.Lock] = None
+
+
+async def get_browser(headless: bool = True, browser_type: str = "chromium",
+                      args: Optional[Sequence[str]] = None, channel: Optional[str] = None) -> Browser:
+    """
+    Get the shared browser, starting Playwright and launching it on first call
+
+    Args:
+        headless (bool): Run browser in headless mode
+        browser_type (str): Playwright browser type ("chromium", "firefox", "webkit")
+        args (Sequence[str]): Launch arguments (only used by the call that launches)
+        channel (str): Browser channel, e.g. "chromium" for Chromium's new headless mode
+
+    Returns:
+        Browser: The process-wide browser for (browser_type, headless)
+    """
+    global _playwright, _lock
+    # Created lazily so the lock belongs to the running event loop
+    if _lock is None:
+        _lock = asyncio.Lock()
+
+    key = (browser_type, headless)
+    async with _lock:
+        browser = _browsers.get(key)
+        if browser is None or not browser.is_connected():
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+
+            logger.info(f"Launching shared {browser_type} browser (headless={headless})")
+            browser = await getattr(_playwright, browser_type).launch(
+                headless=headless,
+                channel=channel,
+                args=list(args or [])
+            )
+            _browsers[key] = browser
+
+    return browser
+
+
+def has_browser(headless: bool = True, browser_type: str = "chromium") -> bool:
+    """Whether a connected shared browser already exists for (browser_type, headless)"""
+    browser = _browsers.get((browser_type, headless))
+    return browser is not None and browser.is_connected()
+
+
+def forget_browser(browser: Browser) -> None:
+    """
+    Drop a browser from the pool so the next get_browser() launches a fresh one
+
+    The caller still owns the browser and closes it once its pages are done
+    (e.g. to recycle a long-lived browser that has leaked renderer memory).
+    """
+    for key, pooled in list(_browsers.items()):
+        if pooled is browser:
+            del _browsers[key]
+
+
+async def close_browsers() -> None:
+    """Close every shared browser and stop Playwright"""
+    global _playwright
+    for browser in _browsers.values():
+        try:
+            await browser.close()
+        except Exception as e:
+            logger.error(f"Error closing shared browser: {str(e)}")
+    _browsers.clear()
+
+    if _playwright is not None:
+        try:
+            await _playwright.stop()
+        except Exception as e:
+            logger.error(f"Error stopping Playwright: {str(e)}")
+        _playwright = None
+        logger.info("Shared browsers closed")
@@ -6,30 +6,35 @@ This module contains all configuration settings for the scraper.
 You can modify these settings to change behavior.
 """
 
+import functools
+import re
+from pathlib import Path
+from types import MappingProxyType
+
 # Target URLs (try different ones if one fails)
-ZARA_URLS = [
+ZARA_URLS = (
     "https://www.zara.com/",
     "https://www.zara.com/us/",
     "https://www.zara.com/en/",
     "https://www.zara.com/us/en/",
-]
+)
 
 # Default URL to use
 DEFAULT_URL = "https://www.zara.com/us/en/"
 
-# Browser settings
-BROWSER_SETTINGS = {
+# Browser settings (read-only; copy before changing per run)
+BROWSER_SETTINGS = MappingProxyType({
     "headless": True,
     "locale": "en-US",
     "timeout": 30000,  # 30 seconds
     "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "viewport": {"width": 1920, "height": 1080},
-    "args": [
+    "args": (
         "--no-sandbox",
+        "--disable-setuid-sandbox",
         "--disable-dev-shm-usage",
         "--disable-gpu",
         "--disable-web-security",
-        "--disable-features=VizDisplayCompositor",
         "--disable-blink-features=AutomationControlled",
         "--disable-extensions",
         "--no-first-run",
@@ -51,18 +56,14 @@ BROWSER_SETTINGS = {
         "--use-mock-keychain",
         "--hide-scrollbars",
         "--mute-audio",
-        "--no-sandbox",
-        "--disable-setuid-sandbox",
-        "--disable-dev-shm-usage",
-        "--disable-accelerated-2d-canvas",
-        "--no-first-run",
-        "--no-zygote",
-        "--disable-gpu"
-    ]
-}
+        # Cap the V8 heap so GC runs before a long crawl hits "Reached heap limit"
+        "--js-flags=--max-old-space-size=512",
+        "--renderer-process-limit=2"
+    )
+})
 
 # Cookie popup selectors
-COOKIE_SELECTORS = [
+COOKIE_SELECTORS = (
     "button[data-testid='cookie-accept']",
     "button:has-text('Accept')",
     "button:has-text('Accept All')",
@@ -81,16 +82,42 @@ COOKIE_SELECTORS = [
     "button[class*='cookie']",
     ".gdpr-accept",
     "#gdpr-accept"
-]
+)
+
+# Broad cookie selectors that also match "Cookies Settings" or "Reject all" buttons
+BROAD_COOKIE_SELECTORS = frozenset({
+    "[data-testid='cookie-banner'] button",
+    "button[aria-label*='Cookie']",
+    "button[class*='cookie']"
+})
+
+# The specific plain-CSS cookie selectors as one selector, so they resolve in a
+# single query. A union resolves in DOM order, so the broad selectors are left out.
+# The :has-text() variants are covered by the accessible-name regex instead
+# (whole words, so "Accept all cookies" matches but "Cookie settings" doesn't).
+COOKIE_SELECTOR_UNION = ", ".join(
+    s for s in COOKIE_SELECTORS if ":has-text" not in s and s not in BROAD_COOKIE_SELECTORS
+)
+COOKIE_TEXT_REGEX = re.compile(r"\b(accept|ok|continue|got it)\b", re.I)
 
 # Output directories
-OUTPUT_DIRS = {
+OUTPUT_DIRS = MappingProxyType({
     "base": "data/scrapes",
     "html": "data/scrapes/html",
     "screenshots": "data/scrapes/screenshots",
     "logs": "data/scrapes/logs",
     "json": "data/scrapes/json"
-}
+})
+
+# Output directories as Path objects
+OUTPUT_PATHS = MappingProxyType({name: Path(path) for name, path in OUTPUT_DIRS.items()})
+
+
+@functools.cache
+def ensure_output_dirs() -> None:
+    """Create the output directories, once per process, when something first writes output"""
+    for path in OUTPUT_PATHS.values():
+        path.mkdir(parents=True, exist_ok=True)
 
 # Logging settings
 LOGGING_CONFIG = {
@@ -110,8 +137,17 @@ SCRAPING_CONFIG = {
     "screenshot_quality": 90
 }
 
+# Maximum number of pages (one BrowserContext each) scraped at the same time
+MAX_PARALLEL_PAGES = 3
+
+# Relaunch the browser after this many pages to release leaked renderer memory
+BROWSER_RECYCLE_PAGES = 20
+
+# Unix socket the long-lived scraper daemon listens on
+DAEMON_SOCKET_PATH = "data/scrapes/scraper.sock"
+
 # Banner extraction selectors
-BANNER_SELECTORS = [
+BANNER_SELECTORS = (
     "a:visible:has-text('SHOP')",
     "a[href*='/shop']",
     "a[href*='/collection']",
@@ -121,4 +157,4 @@ BANNER_SELECTORS = [
     "[data-testid*='banner'] a",
     "[class*='banner'] a",
     "[class*='hero'] a"
-]
+)
@@ -0,0 +1,216 @@
+"""
+Scraper Daemon
+==============
+
+Long-lived scraper service. Starting Playwright's driver and Chromium
+is the largest fixed cost of a scrape, so the daemon pays it once and
+then serves scrape requests over a Unix socket. The browser is relaunched
+every BROWSER_RECYCLE_PAGES scrapes to release leaked renderer memory.
+
+Protocol: one JSON object per line. Send ``{"cmd": "scrape", "url": ...}``
+(``url`` is optional and defaults to the Zara homepage) and the daemon
+replies with the scrape results as one JSON line.
+
+Usage:
+    python -m scraper.daemon
+
+Clients (e.g. run_scraper.py) connect to ``DAEMON_SOCKET_PATH``.
+"""
+
+import asyncio
+import os
+from collections import Counter
+from typing import Dict, Optional
+
+import orjson
+from playwright.async_api import Browser
+from loguru import logger
+
+from scraper._browser_pool import close_browsers, forget_browser, get_browser
+from scraper.batcher import UrlBatcher
+from scraper.config import (
+    BROWSER_RECYCLE_PAGES,
+    BROWSER_SETTINGS,
+    DAEMON_SOCKET_PATH,
+    MAX_PARALLEL_PAGES,
+    ensure_output_dirs,
+)
+from scraper.zara_scraper import BROWSER_CHANNEL, BROWSER_TYPE, LAUNCH_ARGS, ZaraScraper, ZARA_HOME_URL
+
+
+class ScraperDaemon:
+    """
+    Keeps one Playwright driver and one Chromium alive across scrape requests
+    """
+
+    def __init__(self, socket_path: str = DAEMON_SOCKET_PATH):
+        """
+        Initialize the daemon
+
+        Args:
+            socket_path (str): Unix socket to listen on
+        """
+        self.socket_path = socket_path
+        self.browser: Optional[Browser] = None
+        self.pages_served = 0
+        # Scrapes still running on each browser, so a retired one is only
+        # closed once its last page is done
+        self.active: Counter = Counter()
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.batcher = UrlBatcher(self.scrape)
+
+    async def start(self) -> None:
+        """Launch the shared browser"""
+        self.semaphore = asyncio.Semaphore(MAX_PARALLEL_PAGES)
+        self.browser = await self._launch_browser()
+        logger.info("Scraper daemon browser started")
+
+    async def stop(self) -> None:
+        """Finish queued scrapes, then close the browser and Playwright"""
+        await self.batcher.close()
+        await close_browsers()
+        logger.info("Scraper daemon stopped")
+
+    async def _launch_browser(self) -> Browser:
+        """Get the shared browser from the pool, launched with the standard settings"""
+        return await get_browser(
+            headless=BROWSER_SETTINGS["headless"],
+            browser_type=BROWSER_TYPE,
+            args=LAUNCH_ARGS,
+            channel=BROWSER_CHANNEL
+        )
+
+    async def _checkout_browser(self) -> Browser:
+        """
+        Get the browser for the next scrape, recycling it when it is due
+        
+        Returns:
+            Browser: The current shared browser
+        """
+        if self.pages_served >= BROWSER_RECYCLE_PAGES and self.browser is not None:
+            # Retire the old browser; it is closed when its last scrape finishes
+            logger.info(f"Recycling daemon browser after {self.pages_served} pages")
+            forget_browser(self.browser)
+            retired, self.browser = self.browser, None
+            self.pages_served = 0
+            if not self.active[retired]:
+                await self._close_retired(retired)
+
+        if self.browser is None or not self.browser.is_connected():
+            self.browser = await self._launch_browser()
+
+        browser = self.browser
+        self.pages_served += 1
+        self.active[browser] += 1
+        return browser
+
+    async def _checkin_browser(self, browser: Browser) -> None:
+        """Mark a scrape as done and close its browser if that was retired"""
+        self.active[browser] -= 1
+        if not self.active[browser] and browser is not self.browser:
+            await self._close_retired(browser)
+
+    async def _close_retired(self, browser: Browser) -> None:
+        """Close a browser that has been recycled out of the pool"""
+        self.active.pop(browser, None)
+        try:
+            await browser.close()
+        except Exception as e:
+            logger.error(f"Error closing recycled browser: {str(e)}")
+
+    async def scrape(self, url: str) -> Dict:
+        """
+        Scrape one URL in a fresh context on the shared browser
+
+        Args:
+            url (str): Zara page to scrape
+
+        Returns:
+            Dict: The scraper's results
+        """
+        async with self.semaphore:
+            browser = await self._checkout_browser()
+            try:
+                scraper = ZaraScraper(headless=BROWSER_SETTINGS["headless"], url=url)
+                try:
+                    await scraper.open_page(browser)
+                    return await scraper.run_scrape()
+                finally:
+                    # open_page may fail before or after creating the context
+                    if scraper.context:
+                        await scraper.context.close()
+            finally:
+                await self._checkin_browser(browser)
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve newline-delimited JSON requests from one client connection"""
+        try:
+            while line := await reader.readline():
+                try:
+                    request = orjson.loads(line)
+                    if request.get("cmd") != "scrape":
+                        raise ValueError(f"Unknown command: {request.get('cmd')}")
+                    reply = await self.batcher.submit(request.get("url") or ZARA_HOME_URL)
+                except Exception as e:
+                    logger.error(f"Daemon request failed: {str(e)}")
+                    reply = {"success": False, "error": str(e)}
+
+                writer.write(orjson.dumps(reply, option=orjson.OPT_APPEND_NEWLINE))
+                await writer.drain()
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    async def serve_forever(self) -> None:
+        """Listen on the Unix socket until cancelled"""
+        # The socket lives under the output directory
+        ensure_output_dirs()
+        
+        # Remove a stale socket left behind by a previous run
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+        await self.start()
+        server = await asyncio.start_unix_server(self.handle_client, path=self.socket_path)
+        logger.info(f"Scraper daemon listening on {self.socket_path}")
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.stop()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+
+async def request_scrape(url: Optional[str] = None, socket_path: str = DAEMON_SOCKET_PATH) -> Optional[Dict]:
+    """
+    Ask a running daemon to scrape a URL
+
+    Args:
+        url (str): Page to scrape; defaults to the Zara homepage
+        socket_path (str): Unix socket the daemon listens on
+
+    Returns:
+        Dict: The scrape results, or None if no daemon is running
+    """
+    try:
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
+
+    try:
+        writer.write(orjson.dumps({"cmd": "scrape", "url": url}, option=orjson.OPT_APPEND_NEWLINE))
+        await writer.drain()
+        reply = await reader.readline()
+        return orjson.loads(reply) if reply else None
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(ScraperDaemon().serve_forever())
+    except KeyboardInterrupt:
+        pass
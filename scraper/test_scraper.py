@@ -10,14 +10,16 @@ Date: 2025
 """
 
 import asyncio
-import os
-import json
+import itertools
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional
 
+# orjson for fast JSON serialization of the results
+import orjson
 # Playwright for web scraping
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext, Playwright, Response
 # Rich for better console output
 from rich.console import Console
 from rich.table import Table
@@ -31,17 +33,46 @@ LOCALE = "en-US"
 BROWSER_TYPE = "chromium"
 HEADLESS = True
 
+# Run IDs: one wall-clock stamp per process plus a counter, so scrapers
+# created within the same second never overwrite each other's files
+_RUN_PREFIX = datetime.now().strftime("%Y%m%d_%H%M%S")
+_run_counter = itertools.count()
+
+# Timeouts: fail fast instead of holding the shared browser for 30s
+NAVIGATION_TIMEOUT_MS = 8000   # page.goto
+ACTION_TIMEOUT_MS = 5000       # default for every other page operation
+NAVIGATION_DEADLINE_S = 10     # hard asyncio deadline around page.goto
+
+# Chromium launch arguments. --disable-gpu and the VizDisplayCompositor
+# switch force a slower compositing path, and the scraper never needs
+# --disable-web-security, so none of them are passed.
+LAUNCH_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled"
+]
+
+# Only the most recent errors are kept per scrape, so a page that fails
+# hundreds of requests can't grow scrape_data without bound
+MAX_ERRORS = 50
+
+# Subresources the scraper never reads. Stylesheets are kept so screenshots
+# still show the page as laid out.
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
 # Output directories
 OUTPUT_DIR = Path("data/test_scrapes")
 SCREENSHOTS_DIR = OUTPUT_DIR / "screenshots"
 HTML_DIR = OUTPUT_DIR / "html"
 LOGS_DIR = OUTPUT_DIR / "logs"
 
-# Ensure output directories exist
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
-HTML_DIR.mkdir(parents=True, exist_ok=True)
-LOGS_DIR.mkdir(parents=True, exist_ok=True)
+# Ensure output directories exist (one stat when they already do)
+if not all(directory.exists() for directory in (SCREENSHOTS_DIR, HTML_DIR, LOGS_DIR)):
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+    HTML_DIR.mkdir(parents=True, exist_ok=True)
+    LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
 # Setup logging
 logger.add(
@@ -54,19 +85,197 @@ logger.add(
 
 console = Console()
 
+# One Playwright driver and one Chromium shared by every TestScraper in this
+# process; each scraper only gets its own BrowserContext
+_playwright: Optional[Playwright] = None
+_browser: Optional[Browser] = None
+_browser_lock: Optional[asyncio.Lock] = None
+
+
+async def get_browser(headless: bool = HEADLESS) -> Browser:
+    """
+    Get the shared browser, starting Playwright and Chromium on first call
+    
+    Args:
+        headless (bool): Run browser in headless mode (only used on first launch)
+    
+    Returns:
+        Browser: The process-wide Chromium instance
+    """
+    global _playwright, _browser, _browser_lock
+    # Created lazily so the lock belongs to the running event loop
+    if _browser_lock is None:
+        _browser_lock = asyncio.Lock()
+    
+    async with _browser_lock:
+        if _browser is None:
+            logger.info(f"Launching shared {BROWSER_TYPE} browser")
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            try:
+                _browser = await _playwright.chromium.launch(
+                    headless=headless,
+                    args=LAUNCH_ARGS
+                )
+            except Exception:
+                # Don't leave the driver process running without a browser
+                await _playwright.stop()
+                _playwright = None
+                raise
+    
+    return _browser
+
+
+async def shutdown_browser() -> None:
+    """Close the shared browser and stop Playwright (call once before the loop exits)"""
+    global _playwright, _browser
+    try:
+        if _browser:
+            await _browser.close()
+            logger.info("Shared browser closed")
+            
+    except Exception as e:
+        logger.error(f"Error closing browser: {str(e)}")
+    
+    # Stop the driver even if closing the browser failed, so no
+    # Chromium or Node process outlives the scraper
+    try:
+        if _playwright:
+            await _playwright.stop()
+            logger.info("Playwright stopped")
+            
+    except Exception as e:
+        logger.error(f"Error stopping Playwright: {str(e)}")
+    
+    finally:
+        _browser = None
+        _playwright = None
+
+
+class ContextPool:
+    """
+    Bounded pool of reusable browser contexts on the shared browser
+    
+    At most max_contexts contexts are handed out at once; callers beyond
+    that wait for one to be released. A context is retired (closed and
+    later replaced) after serving max_pages scrapes, so per-context memory
+    can't grow without bound on long runs.
+    """
+    
+    def __init__(self, max_contexts: int = 4, max_pages: int = 50, headless: bool = HEADLESS,
+                 **context_options):
+        """
+        Initialize the pool (contexts are created on demand)
+        
+        Args:
+            max_contexts (int): Maximum number of contexts in use at once
+            max_pages (int): Scrapes a context serves before it is retired
+            headless (bool): Run browser in headless mode
+            **context_options: Passed through to browser.new_context()
+        """
+        self.max_contexts = max_contexts
+        self.max_pages = max_pages
+        self.headless = headless
+        self.context_options = context_options
+        self._idle: List[BrowserContext] = []
+        self._uses: Dict[BrowserContext, int] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+    
+    async def acquire(self) -> BrowserContext:
+        """
+        Get a context, waiting if max_contexts are already in use
+        
+        Returns:
+            BrowserContext: An idle context, or a new one on the shared browser
+        """
+        # Created lazily so the semaphore belongs to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_contexts)
+        await self._semaphore.acquire()
+        
+        try:
+            if self._idle:
+                return self._idle.pop()
+            
+            browser = await get_browser(self.headless)
+            context = await browser.new_context(**self.context_options)
+            self._uses[context] = 0
+            return context
+        
+        except Exception:
+            self._semaphore.release()
+            raise
+    
+    async def release(self, context: BrowserContext) -> None:
+        """
+        Return a context to the pool, retiring it once it hits max_pages
+        
+        Args:
+            context (BrowserContext): Context previously returned by acquire()
+        """
+        try:
+            self._uses[context] += 1
+            if self._uses[context] >= self.max_pages:
+                del self._uses[context]
+                await context.close()
+                logger.info("Retired pooled browser context")
+            else:
+                # Don't leak cookies from one scrape into the next
+                await context.clear_cookies()
+                self._idle.append(context)
+        
+        except Exception as e:
+            self._uses.pop(context, None)
+            logger.error(f"Error releasing browser context: {str(e)}")
+        
+        finally:
+            self._semaphore.release()
+    
+    async def close(self) -> None:
+        """Close every idle context (contexts still in use are left alone)"""
+        for context in self._idle:
+            self._uses.pop(context, None)
+            try:
+                await context.close()
+            except Exception as e:
+                logger.error(f"Error closing pooled context: {str(e)}")
+        self._idle = []
+
+
+async def block_heavy_resources(route) -> None:
+    """Abort requests for resource types the scrape doesn't need"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 class TestScraper:
     """
     Test scraper class - uses reliable test website
     """
     
-    def __init__(self, headless: bool = True, locale: str = "en-US"):
+    def __init__(self, headless: bool = True, locale: str = "en-US", block_resources: bool = True,
+                 full_page: bool = False, verbose: bool = True, javascript: bool = False,
+                 pool: Optional[ContextPool] = None):
         self.headless = headless
         self.locale = locale
+        self.verbose = verbose
+        self.block_resources = block_resources
+        self.full_page = full_page
+        self.javascript = javascript
+        # Contexts come from the pool when one is given (its context options apply)
+        self.pool = pool
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
-        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.nav_response: Optional[Response] = None
+        self.timestamp = f"{_RUN_PREFIX}_{next(_run_counter):06d}"
+        
+        # Output files for this run, built once
+        self.html_path = HTML_DIR / f"test_page_{self.timestamp}.html"
+        self.screenshot_path = SCREENSHOTS_DIR / f"test_page_{self.timestamp}.jpg"
+        self.results_path = OUTPUT_DIR / f"test_results_{self.timestamp}.json"
         
         # Track scraping results
         self.scrape_data = {
@@ -78,11 +287,16 @@ class TestScraper:
             "screenshot_file": None,
             "title": None,
             "headings_found": 0,
-            "errors": []
+            "errors": deque(maxlen=MAX_ERRORS)
         }
         
         logger.info(f"Initialized TestScraper with timestamp: {self.timestamp}")
     
+    def _say(self, *args, **kwargs) -> None:
+        """Print to the console only in verbose mode (progress is always logged)"""
+        if self.verbose:
+            console.print(*args, **kwargs)
+    
     async def __aenter__(self):
         """Async context manager entry"""
         await self.start_browser()
@@ -95,55 +309,70 @@ class TestScraper:
     async def start_browser(self) -> None:
         """Start the browser and create context"""
         try:
-            console.print(f"[blue]🚀 Starting {BROWSER_TYPE} browser...[/blue]")
-            logger.info(f"Starting {BROWSER_TYPE} browser")
-            
-            # Launch browser
-            self.browser = await async_playwright().start()
-            browser_instance = await self.browser.chromium.launch(
-                headless=self.headless,
-                args=[
-                    "--no-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-gpu",
-                    "--disable-web-security",
-                    "--disable-features=VizDisplayCompositor"
-                ]
-            )
-            
-            # Create browser context with locale
-            self.context = await browser_instance.new_context(
-                locale=self.locale,
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            )
+            self._say(f"[blue]🚀 Starting {BROWSER_TYPE} browser...[/blue]")
+            logger.opt(lazy=True).info("Starting {} browser", lambda: BROWSER_TYPE)
+            
+            if self.pool:
+                # Borrow a warm context from the pool
+                self.context = await self.pool.acquire()
+            else:
+                # Reuse the shared browser (launched on first use)
+                self.browser = await get_browser(self.headless)
+                
+                # Create browser context with locale
+                # The test page is static HTML, so page scripts are off unless
+                # requested; a smaller viewport also means fewer screenshot pixels
+                self.context = await self.browser.new_context(
+                    locale=self.locale,
+                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+                    java_script_enabled=self.javascript,
+                    bypass_csp=True,
+                    viewport={"width": 1280, "height": 800}
+                )
             
             # Create new page
             self.page = await self.context.new_page()
+            self.page.set_default_timeout(ACTION_TIMEOUT_MS)
+            
+            # Skip images, fonts and media; HTML and headings don't need them
+            if self.block_resources:
+                await self.page.route("**/*", block_heavy_resources)
             
             # Set up error handling
             self.page.on("pageerror", self._handle_page_error)
             self.page.on("requestfailed", self._handle_request_failed)
             
-            console.print(f"[green]✅ Browser started successfully[/green]")
+            self._say(f"[green]✅ Browser started successfully[/green]")
             logger.info("Browser started successfully")
             
         except Exception as e:
             error_msg = f"Failed to start browser: {str(e)}"
-            console.print(f"[red]❌ {error_msg}[/red]")
+            self._say(f"[red]❌ {error_msg}[/red]")
             logger.error(error_msg)
             self.scrape_data["errors"].append(error_msg)
             raise
     
     async def cleanup(self) -> None:
-        """Clean up browser resources"""
+        """
+        Clean up browser resources
+        
+        Only this scraper's context is closed (or its page, with the context
+        returned to the pool); the shared browser stays up for the next
+        scrape and is closed by shutdown_browser().
+        """
         try:
-            if self.context:
+            if self.pool:
+                try:
+                    if self.page:
+                        await self.page.close()
+                finally:
+                    if self.context:
+                        await self.pool.release(self.context)
+                        logger.info("Browser context returned to pool")
+            
+            elif self.context:
                 await self.context.close()
                 logger.info("Browser context closed")
-            
-            if self.browser:
-                await self.browser.stop()
-                logger.info("Browser stopped")
                 
         except Exception as e:
             logger.error(f"Error during cleanup: {str(e)}")
@@ -155,37 +384,51 @@ class TestScraper:
         self.scrape_data["errors"].append(error_msg)
     
     async def _handle_request_failed(self, request) -> None:
-        """Handle failed requests"""
-        error_msg = f"Request failed: {request.url} - {request.failure.get('errorText', 'Unknown error')}"
-        logger.warning(error_msg)
+        """Handle failed requests (requests we aborted ourselves are ignored)"""
+        if self.block_resources and request.resource_type in BLOCKED_RESOURCE_TYPES:
+            return
+        
+        logger.opt(lazy=True).warning(
+            "Request failed: {} - {}",
+            lambda: request.url,
+            lambda: (request.failure or {}).get('errorText', 'Unknown error')
+        )
     
     async def navigate_to_page(self) -> bool:
         """Navigate to the test page"""
         try:
-            console.print(f"[blue]🌐 Navigating to {TEST_URL}...[/blue]")
-            logger.info(f"Navigating to {TEST_URL}")
-            
-            # Navigate to page
-            await self.page.goto(
-                TEST_URL,
-                wait_until="networkidle",
-                timeout=30000  # 30 seconds timeout
+            self._say(f"[blue]🌐 Navigating to {TEST_URL}...[/blue]")
+            logger.opt(lazy=True).info("Navigating to {}", lambda: TEST_URL)
+            
+            # Navigate to page; only the static DOM is needed, so don't wait
+            # for network idle
+            self.nav_response = await asyncio.wait_for(
+                self.page.goto(
+                    TEST_URL,
+                    wait_until="domcontentloaded",
+                    timeout=NAVIGATION_TIMEOUT_MS
+                ),
+                timeout=NAVIGATION_DEADLINE_S
             )
             
-            # Wait for page to be fully loaded
-            await self.page.wait_for_load_state("domcontentloaded")
-            
             # Verify page loaded correctly
             title = await self.page.title()
             self.scrape_data["title"] = title
             
-            console.print(f"[green]✅ Successfully loaded: {title}[/green]")
-            logger.info(f"Successfully loaded page: {title}")
+            self._say(f"[green]✅ Successfully loaded: {title}[/green]")
+            logger.opt(lazy=True).info("Successfully loaded page: {}", lambda: title)
             return True
+        
+        except asyncio.TimeoutError:
+            error_msg = f"Navigation timed out after {NAVIGATION_DEADLINE_S}s"
+            self._say(f"[red]❌ {error_msg}[/red]")
+            logger.error(error_msg)
+            self.scrape_data["errors"].append(error_msg)
+            return False
                 
         except Exception as e:
             error_msg = f"Failed to navigate to page: {str(e)}"
-            console.print(f"[red]❌ {error_msg}[/red]")
+            self._say(f"[red]❌ {error_msg}[/red]")
             logger.error(error_msg)
             self.scrape_data["errors"].append(error_msg)
             return False
@@ -193,22 +436,24 @@ class TestScraper:
     async def save_html(self) -> Optional[str]:
         """Save the current page HTML to file"""
         try:
-            console.print("[blue]💾 Saving HTML content...[/blue]")
+            self._say("[blue]💾 Saving HTML content...[/blue]")
             logger.info("Saving HTML content")
             
-            # Get page HTML
-            html_content = await self.page.content()
+            # Use the raw navigation response body (after redirects) rather than
+            # having the page re-serialize its DOM; fall back to page.content()
+            # if there was no response (e.g. same-document navigation)
+            if self.nav_response is not None:
+                html_bytes = await self.nav_response.body()
+            else:
+                html_bytes = (await self.page.content()).encode('utf-8')
             
-            # Create filename with timestamp
-            html_filename = f"test_page_{self.timestamp}.html"
-            html_filepath = HTML_DIR / html_filename
+            html_filepath = self.html_path
             
-            # Save HTML to file
-            with open(html_filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            # Save HTML to file off the event loop
+            await asyncio.to_thread(html_filepath.write_bytes, html_bytes)
             
-            console.print(f"[green]✅ HTML saved: {html_filepath}[/green]")
-            logger.info(f"HTML saved: {html_filepath}")
+            self._say(f"[green]✅ HTML saved: {html_filepath}[/green]")
+            logger.opt(lazy=True).info("HTML saved: {}", lambda: html_filepath)
             
             # Update scrape data
             self.scrape_data["html_file"] = str(html_filepath)
@@ -217,7 +462,24 @@ class TestScraper:
             
         except Exception as e:
             error_msg = f"Failed to save HTML: {str(e)}"
-            console.print(f"[red]❌ {error_msg}[/red]")
+            self._say(f"[red]❌ {error_msg}[/red]")
+            logger.error(error_msg)
+            self.scrape_data["errors"].append(error_msg)
+            return None
+    
+    async def save_results(self) -> Optional[str]:
+        """Save scrape_data as JSON, serialized with orjson and written in one call"""
+        try:
+            # default=list serializes the errors deque
+            payload = orjson.dumps(self.scrape_data, default=list, option=orjson.OPT_INDENT_2)
+            await asyncio.to_thread(self.results_path.write_bytes, payload)
+            
+            logger.opt(lazy=True).info("Results saved: {}", lambda: self.results_path)
+            return str(self.results_path)
+            
+        except Exception as e:
+            error_msg = f"Failed to save results: {str(e)}"
+            self._say(f"[red]❌ {error_msg}[/red]")
             logger.error(error_msg)
             self.scrape_data["errors"].append(error_msg)
             return None
@@ -225,21 +487,22 @@ class TestScraper:
     async def save_screenshot(self) -> Optional[str]:
         """Save a screenshot of the current page"""
         try:
-            console.print("[blue]📸 Taking screenshot...[/blue]")
+            self._say("[blue]📸 Taking screenshot...[/blue]")
             logger.info("Taking screenshot")
             
-            # Create filename with timestamp
-            screenshot_filename = f"test_page_{self.timestamp}.png"
-            screenshot_filepath = SCREENSHOTS_DIR / screenshot_filename
+            screenshot_filepath = self.screenshot_path
             
-            # Take full page screenshot
-            await self.page.screenshot(
-                path=str(screenshot_filepath),
-                full_page=True
+            # Viewport JPEG by default; full-page captures are opt-in.
+            # Take it into memory, then write it off the event loop
+            screenshot = await self.page.screenshot(
+                type="jpeg",
+                quality=80,
+                full_page=self.full_page
             )
+            await asyncio.to_thread(screenshot_filepath.write_bytes, screenshot)
             
-            console.print(f"[green]✅ Screenshot saved: {screenshot_filepath}[/green]")
-            logger.info(f"Screenshot saved: {screenshot_filepath}")
+            self._say(f"[green]✅ Screenshot saved: {screenshot_filepath}[/green]")
+            logger.opt(lazy=True).info("Screenshot saved: {}", lambda: screenshot_filepath)
             
             # Update scrape data
             self.scrape_data["screenshot_file"] = str(screenshot_filepath)
@@ -248,7 +511,7 @@ class TestScraper:
             
         except Exception as e:
             error_msg = f"Failed to save screenshot: {str(e)}"
-            console.print(f"[red]❌ {error_msg}[/red]")
+            self._say(f"[red]❌ {error_msg}[/red]")
             logger.error(error_msg)
             self.scrape_data["errors"].append(error_msg)
             return None
@@ -256,35 +519,21 @@ class TestScraper:
     async def extract_data(self) -> List[Dict[str, str]]:
         """Extract data from the page"""
         try:
-            console.print("[blue]🔍 Extracting page data...[/blue]")
+            self._say("[blue]🔍 Extracting page data...[/blue]")
             logger.info("Extracting page data")
             
-            # Wait for page to be fully loaded
-            await self.page.wait_for_load_state("networkidle")
+            # Extract all headings in a single round-trip; evaluate_all never
+            # creates element handles on the Python side
+            extracted_data = await self.page.locator("h1, h2, h3, h4, h5, h6").evaluate_all("""els =>
+                els.map((el, i) => ({
+                    type: el.tagName.toLowerCase(),
+                    text: el.innerText.trim(),
+                    index: i
+                })).filter(item => item.text)
+            """)
             
-            # Extract headings
-            headings = await self.page.query_selector_all("h1, h2, h3, h4, h5, h6")
-            extracted_data = []
-            
-            for i, heading in enumerate(headings):
-                try:
-                    text = await heading.inner_text()
-                    tag_name = await heading.evaluate("el => el.tagName.toLowerCase()")
-                    
-                    if text.strip():
-                        data_item = {
-                            "type": tag_name,
-                            "text": text.strip(),
-                            "index": i
-                        }
-                        extracted_data.append(data_item)
-                        
-                except Exception as e:
-                    logger.debug(f"Error extracting heading {i}: {str(e)}")
-                    continue
-            
-            console.print(f"[green]✅ Extracted {len(extracted_data)} elements[/green]")
-            logger.info(f"Extracted {len(extracted_data)} elements")
+            self._say(f"[green]✅ Extracted {len(extracted_data)} elements[/green]")
+            logger.opt(lazy=True).info("Extracted {} elements", lambda: len(extracted_data))
             
             # Update scrape data
             self.scrape_data["headings_found"] = len(extracted_data)
@@ -293,7 +542,7 @@ class TestScraper:
             
         except Exception as e:
             error_msg = f"Failed to extract data: {str(e)}"
-            console.print(f"[red]❌ {error_msg}[/red]")
+            self._say(f"[red]❌ {error_msg}[/red]")
             logger.error(error_msg)
             self.scrape_data["errors"].append(error_msg)
             return []
@@ -301,7 +550,7 @@ class TestScraper:
     async def run_scrape(self) -> Dict:
         """Main scraping method"""
         try:
-            console.print(Panel.fit(
+            self._say(Panel.fit(
                 "[bold blue]Test Scraper - Working Website Example[/bold blue]\n"
                 f"Timestamp: {self.timestamp}\n"
                 f"URL: {TEST_URL}\n"
@@ -316,23 +565,33 @@ class TestScraper:
                 self.scrape_data["success"] = False
                 return self.scrape_data
             
-            # Step 2: Save HTML
-            html_file = await self.save_html()
+            # Step 2: Save HTML, save screenshot and extract data concurrently;
+            # they only read the loaded page, so their waits can overlap
+            html_file, screenshot_file, extracted_data = await asyncio.gather(
+                self.save_html(),
+                self.save_screenshot(),
+                self.extract_data(),
+                return_exceptions=True
+            )
             
-            # Step 3: Save screenshot
-            screenshot_file = await self.save_screenshot()
+            for step, result in (("save HTML", html_file), ("save screenshot", screenshot_file), ("extract data", extracted_data)):
+                if isinstance(result, Exception):
+                    error_msg = f"Failed to {step}: {str(result)}"
+                    logger.error(error_msg)
+                    self.scrape_data["errors"].append(error_msg)
             
-            # Step 4: Extract data
-            extracted_data = await self.extract_data()
+            if isinstance(extracted_data, Exception):
+                extracted_data = []
             
-            # Step 5: Update final status
+            # Step 3: Update final status
             self.scrape_data["success"] = True
             self.scrape_data["extracted_data"] = extracted_data
             
-            # Step 6: Display results
+            # Step 4: Persist and display results
+            await self.save_results()
             self._display_results()
             
-            console.print(Panel.fit(
+            self._say(Panel.fit(
                 "[bold green]✅ Test Scraping Completed Successfully![/bold green]",
                 title="🎉 Success"
             ))
@@ -342,7 +601,7 @@ class TestScraper:
             
         except Exception as e:
             error_msg = f"Test scraping failed: {str(e)}"
-            console.print(f"[red]❌ {error_msg}[/red]")
+            self._say(f"[red]❌ {error_msg}[/red]")
             logger.error(error_msg)
             self.scrape_data["errors"].append(error_msg)
             self.scrape_data["success"] = False
@@ -350,6 +609,17 @@ class TestScraper:
     
     def _display_results(self) -> None:
         """Display scraping results in a nice format"""
+        if not self.verbose:
+            return
+        
+        # Not a terminal (CI, cron): log a one-line summary instead of rendering tables
+        if not console.is_terminal:
+            logger.info(
+                f"Scrape result: {self.scrape_data['headings_found']} headings, "
+                f"success={self.scrape_data['success']}, errors={len(self.scrape_data['errors'])}"
+            )
+            return
+        
         try:
             # Create results table
             table = Table(title="📊 Test Scraping Results")
@@ -410,6 +680,9 @@ async def main():
         console.print(f"[red]❌ Main function error: {str(e)}[/red]")
         logger.error(f"Main function error: {str(e)}")
         return {"success": False, "error": str(e)}
+    
+    finally:
+        await shutdown_browser()
 
 
 if __name__ == "__main__":
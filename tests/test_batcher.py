@@ -0,0 +1,106 @@
+"""
+UrlBatcher Tests
+================
+
+Pure asyncio tests for the tumbling-window URL batcher.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from scraper.batcher import UrlBatcher
+
+
+class RecordingBatcher(UrlBatcher):
+    """UrlBatcher that remembers the URLs of every dispatched batch"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batches = []
+
+    async def _run_batch(self, batch):
+        self.batches.append([url for url, _ in batch])
+        await super()._run_batch(batch)
+
+
+def test_results_come_back_to_their_submitters():
+    """Each submitter gets the result for its own URL, whatever the finish order"""
+    async def scrape(url: str) -> str:
+        await asyncio.sleep(0.01 * (5 - int(url)))
+        return f"scraped {url}"
+
+    async def run():
+        batcher = UrlBatcher(scrape)
+        return await asyncio.gather(*(batcher.submit(str(i)) for i in range(5)))
+
+    assert asyncio.run(run()) == [f"scraped {i}" for i in range(5)]
+
+
+def test_failing_url_is_isolated():
+    """One URL raising doesn't affect the others in its batch"""
+    async def scrape(url: str) -> str:
+        if url == "bad":
+            raise ValueError("boom")
+        return url
+
+    async def run():
+        batcher = UrlBatcher(scrape)
+        return await asyncio.gather(
+            batcher.submit("a"), batcher.submit("bad"), batcher.submit("b"),
+            return_exceptions=True
+        )
+
+    first, failed, last = asyncio.run(run())
+    assert (first, last) == ("a", "b")
+    assert isinstance(failed, ValueError)
+
+
+def test_max_batch_splits_the_window():
+    """A full batch is dispatched at once; the rest waits for the window"""
+    async def run():
+        batcher = RecordingBatcher(lambda url: asyncio.sleep(0, url), window_ms=20, max_batch=2)
+        results = await asyncio.gather(*(batcher.submit(url) for url in "abcde"))
+        return batcher.batches, results
+
+    batches, results = asyncio.run(run())
+    assert batches == [["a", "b"], ["c", "d"], ["e"]]
+    assert results == list("abcde")
+
+
+def test_cancelled_submitter_is_not_scraped():
+    """A URL whose submitter was cancelled during the window never reaches scrape"""
+    scraped = []
+
+    async def scrape(url: str) -> str:
+        scraped.append(url)
+        return url
+
+    async def run():
+        batcher = UrlBatcher(scrape, window_ms=20)
+        cancelled = asyncio.create_task(batcher.submit("x"))
+        kept = asyncio.create_task(batcher.submit("y"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        return await kept
+
+    assert asyncio.run(run()) == "y"
+    assert scraped == ["y"]
+
+
+def test_close_flushes_the_open_window():
+    """close() dispatches queued URLs without waiting out the window"""
+    async def run():
+        batcher = UrlBatcher(lambda url: asyncio.sleep(0, url), window_ms=10_000)
+        pending = asyncio.create_task(batcher.submit("a"))
+        await asyncio.sleep(0)
+        started = time.monotonic()
+        await batcher.close()
+        return await pending, time.monotonic() - started
+
+    result, elapsed = asyncio.run(run())
+    assert result == "a"
+    assert elapsed < 1
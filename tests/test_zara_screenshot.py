@@ -0,0 +1,51 @@
+"""
+ZaraScraper Screenshot Tests
+============================
+
+Checks that full-page screenshots really cover the whole page, not just
+the viewport. Needs Playwright's Chromium and Pillow; skipped otherwise.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("playwright")
+Image = pytest.importorskip("PIL.Image")
+
+from playwright.async_api import async_playwright
+
+from scraper import zara_scraper
+from scraper.zara_scraper import ZaraScraper
+
+VIEWPORT = {"width": 800, "height": 600}
+PAGE_HEIGHT = 3000
+
+
+def test_full_page_screenshot_is_taller_than_viewport(tmp_path, monkeypatch):
+    """A full_page screenshot over CDP captures beyond the viewport"""
+    # The scraper creates its output and log directories relative to the
+    # working directory, so keep them out of the checkout
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(zara_scraper, "SCREENSHOTS_DIR", tmp_path)
+
+    async def take_screenshot() -> str:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch()
+            try:
+                scraper = ZaraScraper(full_page=True)
+                scraper.context = await browser.new_context(viewport=VIEWPORT)
+                scraper.page = await scraper.context.new_page()
+                await scraper.page.set_content(
+                    f"<body style='margin:0'><div style='height:{PAGE_HEIGHT}px'>tall</div></body>"
+                )
+                return await scraper.save_screenshot()
+            finally:
+                await browser.close()
+
+    screenshot_path = asyncio.run(take_screenshot())
+
+    assert screenshot_path is not None
+    with Image.open(screenshot_path) as image:
+        assert image.height > VIEWPORT["height"]
+        assert image.height >= PAGE_HEIGHT